@@ -0,0 +1,230 @@
+import datetime as dt
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, FrozenSet, Iterator, List, Tuple
+
+
+# --------------------- Holiday helpers ---------------------
+
+
+# Bit i set when weekday i (Monday=0 .. Sunday=6) is a business day.
+_BUSINESS_WEEKDAY_MASK = 0b0011111
+# Days to add from each weekday to reach the next business weekday
+# (Saturday -> Monday is 2, Sunday -> Monday is 1).
+_WEEKEND_SKIP = (0, 0, 0, 0, 0, 2, 1)
+# Days to move a fixed-date holiday to its observed date, by weekday
+# (Saturday -> Friday, Sunday -> Monday).
+_OBSERVED_SHIFT = (0, 0, 0, 0, 0, -1, 1)
+
+
+def nth_weekday_of_month(year: int, month: int, weekday: int, n: int) -> dt.date:
+    """
+    Return the date of the n-th given weekday in a month.
+    month: 1-12, weekday: 0=Monday..6=Sunday, n>=1
+    weekday uses Python convention: Monday=0..Sunday=6.
+    """
+    first_wd = dt.date(year, month, 1).weekday()
+    return dt.date(year, month, 1 + (weekday - first_wd) % 7 + 7 * (n - 1))
+
+
+def last_weekday_of_month(year: int, month: int, weekday: int) -> dt.date:
+    """
+    Return the date of the last given weekday in a month.
+    month: 1-12, weekday: 0=Monday..6=Sunday
+    """
+    first_wd, last_day = monthrange(year, month)
+    last_wd = (first_wd + last_day - 1) % 7
+    return dt.date(year, month, last_day - (last_wd - weekday) % 7)
+
+
+def observed_date(date: dt.date) -> dt.date:
+    """
+    If holiday falls on Saturday -> observed Friday.
+    If holiday falls on Sunday -> observed Monday.
+    Otherwise, observe on the same day.
+    """
+    shift = _OBSERVED_SHIFT[date.weekday()]
+    if shift:
+        return date + dt.timedelta(days=shift)
+    return date
+
+
+@lru_cache(maxsize=None)
+def get_us_holidays_for_year(year: int) -> FrozenSet[dt.date]:
+    """
+    Return a set of US federal holidays (observed dates) for a given year.
+    """
+    return frozenset((
+        # 1. New Year's Day (Jan 1)
+        observed_date(dt.date(year, 1, 1)),
+        # 2. MLK Day (3rd Monday in January)
+        nth_weekday_of_month(year, 1, weekday=0, n=3),  # Monday
+        # 3. Presidents Day (3rd Monday in February)
+        nth_weekday_of_month(year, 2, weekday=0, n=3),
+        # 4. Memorial Day (last Monday in May)
+        last_weekday_of_month(year, 5, weekday=0),
+        # 5. Juneteenth (June 19, observed)
+        observed_date(dt.date(year, 6, 19)),
+        # 6. Independence Day (July 4, observed)
+        observed_date(dt.date(year, 7, 4)),
+        # 7. Labor Day (1st Monday in September)
+        nth_weekday_of_month(year, 9, weekday=0, n=1),
+        # 8. Columbus Day / Indigenous Peoples' Day (2nd Monday in October)
+        nth_weekday_of_month(year, 10, weekday=0, n=2),
+        # 9. Veterans Day (Nov 11, observed)
+        observed_date(dt.date(year, 11, 11)),
+        # 10. Thanksgiving Day (4th Thursday in November)
+        nth_weekday_of_month(year, 11, weekday=3, n=4),  # Thursday
+        # 11. Christmas Day (Dec 25, observed)
+        observed_date(dt.date(year, 12, 25)),
+    ))
+
+
+@lru_cache(maxsize=None)
+def _holiday_ordinals(year: int) -> FrozenSet[int]:
+    """
+    Holidays for a year as date ordinals, keeping only those that fall inside
+    the year to match is_federal_holiday (a Jan 1 holiday observed on Dec 31
+    is not counted).
+    """
+    return frozenset(
+        d.toordinal() for d in get_us_holidays_for_year(year) if d.year == year
+    )
+
+
+def is_federal_holiday(date: dt.date) -> bool:
+    holidays = YEAR_HOLIDAYS.get(date.year) or get_us_holidays_for_year(date.year)
+    return date in holidays
+
+
+def is_weekend(date: dt.date) -> bool:
+    return not (_BUSINESS_WEEKDAY_MASK >> date.weekday()) & 1
+
+
+def is_business_day(date: dt.date) -> bool:
+    return not is_weekend(date) and not is_federal_holiday(date)
+
+
+def _extension_horizon(year: int) -> int:
+    """
+    Ordinal at which a holiday window ending with year needs year + 1 added;
+    past dt.date.max when year is dt.MAXYEAR, so it is never extended.
+    """
+    if year < dt.MAXYEAR:
+        return dt.date(year, 1, 1).toordinal()
+    return dt.date.max.toordinal() + 1
+
+
+def _business_ordinals(start_date: dt.date) -> Iterator[int]:
+    """
+    Yield the ordinals of business days from start_date onwards (inclusive).
+    """
+    # Work on ordinals (Monday=0 is (ordinal - 1) % 7) so callers only build
+    # dt.date objects for the days they keep.
+    o = start_date.toordinal()
+    # Merge holidays for this year and next up front; extended below only
+    # if the range runs past the covered window. There are no years past
+    # dt.MAXYEAR to add, so the horizon stops there.
+    year = start_date.year
+    holidays = _holiday_ordinals(year)
+    if year < dt.MAXYEAR:
+        year += 1
+        holidays = holidays | _holiday_ordinals(year)
+    horizon = _extension_horizon(year)
+
+    # Jump straight to Monday when starting on a weekend, without a branch.
+    o += _WEEKEND_SKIP[(o - 1) % 7]
+    wd = (o - 1) % 7
+
+    while True:
+        if o >= horizon:
+            year += 1
+            horizon = _extension_horizon(year)
+            holidays = holidays | _holiday_ordinals(year)
+        # Walk the remaining weekdays of this week, then hop the weekend.
+        for _ in range(5 - wd):
+            if o not in holidays:
+                yield o
+            o += 1
+        o += 2
+        wd = 0
+
+
+def calculate_business_dates(start_date: dt.date, business_days: int) -> List[dt.date]:
+    """
+    Return a list of business dates, counting start_date as Day 1
+    if it is a business day. List length == business_days when successful.
+    """
+    if business_days <= 0:
+        return []
+    return [
+        dt.date.fromordinal(o)
+        for o in islice(_business_ordinals(start_date), business_days)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _holiday_window(year: int, business_days: int) -> Tuple[int, ...]:
+    """
+    Sorted holiday ordinals for every year a run of business_days starting
+    in year can reach. A year has at least 249 business days, so
+    n // 240 + 1 extra years is always enough; years past dt.MAXYEAR do
+    not exist and are left out.
+    """
+    window: FrozenSet[int] = frozenset()
+    for y in range(year, min(year + business_days // 240 + 2, dt.MAXYEAR + 1)):
+        window |= _holiday_ordinals(y)
+    return tuple(sorted(window))
+
+
+def _add_weekdays(o: int, k: int) -> int:
+    """
+    Return the ordinal k weekdays after weekday ordinal o, ignoring holidays.
+    """
+    wd = (o - 1) % 7
+    total = wd + k
+    return o - wd + total // 5 * 7 + total % 5
+
+
+def _business_day_offset_kernel(start_ord: int, n: int, holiday_ords: Tuple[int, ...]) -> int:
+    """
+    Return the ordinal of the n-th business day from start_ord (inclusive).
+    Jumps straight to the n-th weekday, then pushes the end out by however
+    many holidays fell in the span just covered until none are left.
+    """
+    lo = start_ord + _WEEKEND_SKIP[(start_ord - 1) % 7]
+    end = _add_weekdays(lo, n - 1)
+    missing = bisect_right(holiday_ords, end) - bisect_left(holiday_ords, lo)
+    while missing:
+        lo = end + 1
+        end = _add_weekdays(end, missing)
+        missing = bisect_right(holiday_ords, end) - bisect_left(holiday_ords, lo)
+    return end
+
+
+def business_day_offset(start_date: dt.date, business_days: int) -> dt.date:
+    """
+    Return the business_days-th business date, counting start_date as Day 1
+    if it is a business day. Same as calculate_business_dates(...)[-1]
+    without building the list.
+    """
+    if business_days <= 0:
+        raise ValueError("business_days must be at least 1")
+    holiday_ords = _holiday_window(start_date.year, business_days)
+    return dt.date.fromordinal(
+        _business_day_offset_kernel(start_date.toordinal(), business_days, holiday_ords)
+    )
+
+
+# Materialize holiday sets around the current year at import so requests in
+# this horizon never hit the cache-miss path; other years fall back to
+# get_us_holidays_for_year.
+_this_year = dt.date.today().year
+YEAR_HOLIDAYS: Dict[int, FrozenSet[dt.date]] = {
+    year: get_us_holidays_for_year(year)
+    for year in range(_this_year - 1, _this_year + 5)
+}
+for _year in YEAR_HOLIDAYS:
+    _holiday_ordinals(_year)